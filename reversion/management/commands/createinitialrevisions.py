@@ -5,7 +5,7 @@ from django.core.management import CommandError
 from django.db import reset_queries, transaction, router
 from reversion.models import Revision, Version, _safe_subquery
 from reversion.management.commands import BaseRevisionCommand
-from reversion.revisions import create_revision, set_comment, add_to_revision, add_meta
+from reversion.revisions import create_revision, set_comment, add_to_revision, add_meta, _prefetch_follow
 
 
 class Command(BaseRevisionCommand):
@@ -75,7 +75,7 @@ class Command(BaseRevisionCommand):
                 total = len(ids)
                 for i in range(0, total, batch_size):
                     chunked_ids = ids[i:i+batch_size]
-                    objects = live_objs.in_bulk(chunked_ids)
+                    objects = _prefetch_follow(live_objs).in_bulk(chunked_ids)
                     for obj in objects.values():
                         with create_revision(using=using):
                             if meta:
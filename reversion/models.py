@@ -19,7 +19,7 @@ from django.utils.translation import gettext_lazy as _
 
 from reversion.errors import RevertError
 from reversion.revisions import (_follow_relations_recursive,
-                                 _get_content_type, _get_options)
+                                 _get_content_type, _get_options, _prefetch_follow)
 
 
 def _safe_revert(versions):
@@ -81,14 +81,15 @@ class Revision(models.Model):
                 # Optionally delete objects no longer in the current revision.
                 if delete:
                     # Get a set of all objects in this revision.
-                    old_revision = set()
+                    model_object_ids = defaultdict(list)
                     for version in versions:
-                        model = version._model
-                        try:
-                            # Load the model instance from the same DB as it was saved under.
-                            old_revision.add(model._default_manager.using(version.db).get(pk=version.object_id))
-                        except model.DoesNotExist:
-                            pass
+                        model_object_ids[version._model].append(version.object_id)
+                    old_revision = set()
+                    for model, object_ids in model_object_ids.items():
+                        # Load the model instances from the same DB as they were saved under.
+                        old_revision.update(_prefetch_follow(
+                            model._default_manager.using(version_db),
+                        ).in_bulk(object_ids).values())
                     # Calculate the set of all objects that are in the revision now.
                     current_revision = chain.from_iterable(
                         _follow_relations_recursive(obj)
@@ -284,16 +285,14 @@ class Version(models.Model):
         version_options = _get_options(self._model)
         object_version = self._object_version
         obj = object_version.object
-        model = self._model
         field_dict = {}
-        for field_name in version_options.fields:
-            field = model._meta.get_field(field_name)
-            if isinstance(field, models.ManyToManyField):
+        for attname, is_m2m in version_options.field_attnames:
+            if is_m2m:
                 # M2M fields with a custom through are not stored in m2m_data, but as a separate model.
-                if object_version.m2m_data and field.attname in object_version.m2m_data:
-                    field_dict[field.attname] = object_version.m2m_data[field.attname]
+                if object_version.m2m_data and attname in object_version.m2m_data:
+                    field_dict[attname] = object_version.m2m_data[attname]
             else:
-                field_dict[field.attname] = getattr(obj, field.attname)
+                field_dict[attname] = getattr(obj, attname)
         return field_dict
 
     @cached_property
@@ -1,10 +1,12 @@
 from collections import namedtuple, defaultdict
 from contextlib import contextmanager
-from functools import wraps
+from functools import lru_cache, wraps
 from threading import local
 from django.apps import apps
 from django.core import serializers
-from django.core.exceptions import ObjectDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder, Serializer as JSONSerializer
+from django.core.serializers.python import Serializer as PythonSerializer
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
 from django.db import models, transaction, router
 from django.db.models.query import QuerySet
 from django.db.models.signals import post_save, m2m_changed
@@ -16,6 +18,7 @@ from reversion.signals import pre_revision_commit, post_revision_commit
 
 _VersionOptions = namedtuple("VersionOptions", (
     "fields",
+    "field_attnames",
     "follow",
     "format",
     "for_concrete_model",
@@ -34,23 +37,39 @@ _StackFrame = namedtuple("StackFrame", (
 ))
 
 
-class _Local(local):
+try:
+    from contextvars import ContextVar
+except ImportError:  # pragma: no cover
+    # Python 3.6 doesn't have context variables, so fall back to a thread-local stack.
+    class _Local(local):
 
-    def __init__(self):
-        self.stack = ()
+        def __init__(self):
+            self.stack = ()
 
+    _local = _Local()
 
-_local = _Local()
+    def _get_stack():
+        return _local.stack
+
+    def _set_stack(stack):
+        _local.stack = stack
+else:
+    _stack = ContextVar("reversion_stack", default=())
+
+    _get_stack = _stack.get
+
+    _set_stack = _stack.set
 
 
 def is_active():
-    return bool(_local.stack)
+    return bool(_get_stack())
 
 
 def _current_frame():
-    if not is_active():
+    stack = _get_stack()
+    if not stack:
         raise RevisionManagementError("There is no active revision for this thread")
-    return _local.stack[-1]
+    return stack[-1]
 
 
 def _copy_db_versions(db_versions):
@@ -79,16 +98,17 @@ def _push_frame(manage_manually, using):
             db_versions={using: {}},
             meta=(),
         )
-    _local.stack += (stack_frame,)
+    _set_stack(_get_stack() + (stack_frame,))
 
 
 def _update_frame(**kwargs):
-    _local.stack = _local.stack[:-1] + (_current_frame()._replace(**kwargs),)
+    current_frame = _current_frame()
+    _set_stack(_get_stack()[:-1] + (current_frame._replace(**kwargs),))
 
 
 def _pop_frame():
     prev_frame = _current_frame()
-    _local.stack = _local.stack[:-1]
+    _set_stack(_get_stack()[:-1])
     if is_active():
         current_frame = _current_frame()
         db_versions = {
@@ -137,8 +157,9 @@ def add_meta(model, **values):
     _update_frame(meta=_current_frame().meta + ((model, values),))
 
 
-def _follow_relations(obj):
-    version_options = _get_options(obj.__class__)
+def _follow_relations(obj, version_options=None):
+    if version_options is None:
+        version_options = _get_options(obj.__class__)
     for follow_name in version_options.follow:
         try:
             follow_obj = getattr(obj, follow_name)
@@ -147,8 +168,8 @@ def _follow_relations(obj):
         if isinstance(follow_obj, models.Model):
             yield follow_obj
         elif isinstance(follow_obj, (models.Manager, QuerySet)):
-            for follow_obj_instance in follow_obj.all():
-                yield follow_obj_instance
+            # Use all() rather than iterator(), so any prefetched results are reused.
+            yield from follow_obj.all()
         elif follow_obj is not None:
             raise RegistrationError("{name}.{follow_name} should be a Model or QuerySet".format(
                 name=obj.__class__.__name__,
@@ -156,57 +177,173 @@ def _follow_relations(obj):
             ))
 
 
+def _get_follow_lookups(model):
+    return _resolve_follow_lookups(model, _get_options(model).follow)
+
+
+@lru_cache(maxsize=None)
+def _resolve_follow_lookups(model, follow):
+    # Resolved lazily (and cached) rather than in register(), since reverse relations aren't available until all
+    # models are loaded.
+    select_related = []
+    prefetch_related = []
+    for field in model._meta.get_fields():
+        if not field.is_relation:
+            continue
+        # Reverse relations are followed by their accessor name.
+        follow_name = field.get_accessor_name() if field.auto_created and not field.concrete else field.name
+        if follow_name not in follow:
+            continue
+        if field.one_to_one or (field.many_to_one and field.concrete):
+            select_related.append(follow_name)
+        else:
+            prefetch_related.append(follow_name)
+    return tuple(select_related), tuple(prefetch_related)
+
+
+def _prefetch_follow(queryset):
+    # Load followed relations in bulk. Followed attributes that aren't relations are loaded lazily.
+    if not is_registered(queryset.model):
+        return queryset
+    select_related, prefetch_related = _get_follow_lookups(queryset.model)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset
+
+
+def _get_follow_key(obj):
+    return (obj._meta.concrete_model, obj.pk)
+
+
 def _follow_relations_recursive(obj):
-    def do_follow(obj):
-        if obj not in relations:
-            relations.add(obj)
-            for related in _follow_relations(obj):
-                do_follow(related)
-    relations = set()
-    do_follow(obj)
-    return relations
+    relations = {}
+    model_options = {}
+    work = [obj]
+    while work:
+        obj = work.pop()
+        follow_key = _get_follow_key(obj)
+        if follow_key not in relations:
+            relations[follow_key] = obj
+            model = obj.__class__
+            version_options = model_options.get(model)
+            if version_options is None:
+                version_options = model_options[model] = _get_options(model)
+            work.extend(_follow_relations(obj, version_options))
+    return set(relations.values())
+
+
+# Encodes json exactly as the json serializer does. Encoders keep no state between calls, so this can be shared.
+_json_encoder = DjangoJSONEncoder(ensure_ascii=False)
+
+
+def _serialize(version_options, objs):
+    # Serialize each object separately, using a single serializer pass where possible.
+    options = {
+        "fields": version_options.fields,
+        "use_natural_foreign_keys": version_options.use_natural_foreign_keys,
+    }
+    # Look the serializer up once per batch. This isn't done in register(), since formats can be registered after
+    # the models that use them.
+    serializer = serializers.get_serializer(version_options.format)
+    # The json serializer is the python serializer plus a json.dump() per object, so the per-object output can be
+    # produced from a single python serializer pass. Custom json serializers must be used as-is.
+    if serializer is JSONSerializer:
+        return [
+            _json_encoder.encode([data])
+            for data in PythonSerializer().serialize(objs, **options)
+        ]
+    return [
+        serializer().serialize((obj,), **options)
+        for obj in objs
+    ]
 
 
-def _add_to_revision(obj, using, model_db, explicit):
+def _get_version_key(obj, version_options, using):
+    content_type = _get_content_type_for_options(obj.__class__, version_options, using)
+    return content_type, (content_type.pk, force_str(obj.pk))
+
+
+def _add_version(obj, using, model_db, explicit, serialized_data=None):
     from reversion.models import Version
     # Exit early if the object is not fully-formed.
     if obj.pk is None:
-        return
+        return False
     version_options = _get_options(obj.__class__)
-    content_type = _get_content_type(obj.__class__, using)
-    object_id = force_str(obj.pk)
-    version_key = (content_type, object_id)
+    content_type, version_key = _get_version_key(obj, version_options, using)
+    object_id = version_key[1]
     # If the obj is already in the revision, stop now.
     db_versions = _current_frame().db_versions
     versions = db_versions[using]
     if version_key in versions and not explicit:
-        return
+        return False
     # Get the version data.
+    if serialized_data is None:
+        serialized_data, = _serialize(version_options, (obj,))
+    # If the version is a duplicate, stop now. Identical serialized data is always a duplicate, so check that before
+    # building and deserializing the version.
+    previous_version = None
+    if version_options.ignore_duplicates and explicit:
+        # Only the columns needed for the comparison are loaded.
+        previous_version = Version.objects.using(using).filter(
+            db=model_db,
+            content_type_id=content_type.pk,
+            object_id=object_id,
+        ).only("content_type", "format", "serialized_data").first()
+        if previous_version and (
+            (previous_version.format, previous_version.serialized_data) == (version_options.format, serialized_data)
+        ):
+            return False
     version = Version(
         content_type=content_type,
         object_id=object_id,
         db=model_db,
         format=version_options.format,
-        serialized_data=serializers.serialize(
-            version_options.format,
-            (obj,),
-            fields=version_options.fields,
-            use_natural_foreign_keys=version_options.use_natural_foreign_keys,
-        ),
+        serialized_data=serialized_data,
         object_repr=force_str(obj),
     )
-    # If the version is a duplicate, stop now.
-    if version_options.ignore_duplicates and explicit:
-        previous_version = Version.objects.using(using).get_for_object(obj, model_db=model_db).first()
-        if previous_version and previous_version._local_field_dict == version._local_field_dict:
-            return
-    # Store the version.
-    db_versions = _copy_db_versions(db_versions)
-    db_versions[using][version_key] = version
-    _update_frame(db_versions=db_versions)
-    # Follow relations.
-    for follow_obj in _follow_relations(obj):
-        _add_to_revision(follow_obj, using, model_db, False)
+    if previous_version and previous_version._local_field_dict == version._local_field_dict:
+        return False
+    # Store the version. Each stack frame is given its own copy of db_versions when pushed, so this is safe to do
+    # in-place.
+    versions[version_key] = version
+    return True
+
+
+def _serialize_follow_objs(follow_objs, using):
+    # Serialize the followed objects that aren't already in the revision, one serializer pass per model.
+    versions = _current_frame().db_versions[using]
+    model_options = {}
+    model_objs = defaultdict(list)
+    for follow_obj in follow_objs:
+        if follow_obj.pk is not None:
+            model = follow_obj.__class__
+            version_options = model_options.get(model)
+            if version_options is None:
+                version_options = model_options[model] = _get_options(model)
+            if _get_version_key(follow_obj, version_options, using)[1] not in versions:
+                model_objs[model].append(follow_obj)
+    serialized_data = {}
+    for model, objs in model_objs.items():
+        for obj, data in zip(objs, _serialize(model_options[model], objs)):
+            serialized_data[id(obj)] = data
+    return [serialized_data.get(id(follow_obj)) for follow_obj in follow_objs]
+
+
+def _add_to_revision(obj, using, model_db, explicit):
+    # Use a worklist rather than recursion, so long follow chains can't hit the recursion limit.
+    work = [(obj, explicit, None)]
+    while work:
+        obj, explicit, serialized_data = work.pop()
+        if _add_version(obj, using, model_db, explicit, serialized_data):
+            follow_objs = list(_follow_relations(obj))
+            follow_data = _serialize_follow_objs(follow_objs, using)
+            work.extend(
+                (follow_obj, False, data)
+                for follow_obj, data
+                in zip(reversed(follow_objs), reversed(follow_data))
+            )
 
 
 def add_to_revision(obj, model_db=None):
@@ -215,13 +352,21 @@ def add_to_revision(obj, model_db=None):
         _add_to_revision(obj, db, model_db, True)
 
 
+_BULK_CREATE_BATCH_SIZE = 500
+
+
 def _save_revision(versions, user=None, comment="", meta=(), date_created=None, using=None):
-    from reversion.models import Revision
+    from reversion.models import Revision, Version
+    # The content type is already attached to each pending version, so use it rather than looking it up again.
+    version_models = [
+        (version, version.content_type.model_class())
+        for version in versions
+    ]
     # Only save versions that exist in the database.
-    # Use _base_manager so we don't have problems when _default_manager is overriden
     model_db_pks = defaultdict(lambda: defaultdict(set))
-    for version in versions:
-        model_db_pks[version._model][version.db].add(version.object_id)
+    for version, model in version_models:
+        model_db_pks[model][version.db].add(version.object_id)
+    # Use _base_manager so we don't have problems when _default_manager is overriden
     model_db_existing_pks = {
         model: {
             db: frozenset(map(
@@ -233,8 +378,8 @@ def _save_revision(versions, user=None, comment="", meta=(), date_created=None,
         for model, db_pks in model_db_pks.items()
     }
     versions = [
-        version for version in versions
-        if version.object_id in model_db_existing_pks[version._model][version.db]
+        version for version, model in version_models
+        if version.object_id in model_db_existing_pks[model][version.db]
     ]
     # Bail early if there are no objects to save.
     if not versions:
@@ -256,13 +401,22 @@ def _save_revision(versions, user=None, comment="", meta=(), date_created=None,
     # Save version models.
     for version in versions:
         version.revision = revision
-        version.save(using=using)
+    Version.objects.using(using).bulk_create(versions, batch_size=_BULK_CREATE_BATCH_SIZE)
     # Save the meta information.
+    meta_model_fields = defaultdict(list)
     for meta_model, meta_fields in meta:
-        meta_model._base_manager.db_manager(using=using).create(
-            revision=revision,
-            **meta_fields
-        )
+        meta_model_fields[meta_model].append(meta_fields)
+    for meta_model, meta_fields_list in meta_model_fields.items():
+        meta_objs = [
+            meta_model(revision=revision, **meta_fields)
+            for meta_fields in meta_fields_list
+        ]
+        # Multi-table inherited models can't be bulk created.
+        if meta_model._meta.concrete_model._meta.parents:
+            for meta_obj in meta_objs:
+                meta_obj.save(force_insert=True, using=using)
+        else:
+            meta_model._base_manager.db_manager(using=using).bulk_create(meta_objs)
     # Send the post_revision_commit signal.
     post_revision_commit.send(
         sender=create_revision,
@@ -284,7 +438,7 @@ def _create_revision_context(manage_manually, using, atomic):
         try:
             yield
             # Only save for a db if that's the last stack frame for that db.
-            if not any(using in frame.db_versions for frame in _local.stack[:-1]):
+            if not any(using in frame.db_versions for frame in _get_stack()[:-1]):
                 current_frame = _current_frame()
                 _save_revision(
                     versions=current_frame.db_versions[using].values(),
@@ -375,17 +529,34 @@ def register(model=None, fields=None, exclude=(), follow=(), format="json",
             ))
         # Parse fields.
         opts = model._meta.concrete_model._meta
+        field_names = tuple(
+            field_name
+            for field_name
+            in ([
+                field.name
+                for field
+                in opts.local_fields + opts.local_many_to_many
+            ] if fields is None else fields)
+            if field_name not in exclude
+        )
+        # Resolve the field attnames once, rather than every time a version is compared.
+        field_attnames = []
+        for field_name in field_names:
+            try:
+                field = opts.get_field(field_name)
+            except FieldDoesNotExist:
+                raise RegistrationError("{model}.{field_name} is not a field".format(
+                    model=model.__name__,
+                    field_name=field_name,
+                ))
+            is_m2m = isinstance(field, models.ManyToManyField)
+            # Non-concrete fields (e.g. generic foreign keys and reverse relations) are never serialized.
+            if not field.concrete and not is_m2m:
+                continue
+            field_attnames.append((field.attname, is_m2m))
         version_options = _VersionOptions(
-            fields=tuple(
-                field_name
-                for field_name
-                in ([
-                    field.name
-                    for field
-                    in opts.local_fields + opts.local_many_to_many
-                ] if fields is None else fields)
-                if field_name not in exclude
-            ),
+            fields=field_names,
+            field_attnames=tuple(field_attnames),
             follow=tuple(follow),
             format=format,
             for_concrete_model=for_concrete_model,
@@ -406,29 +577,33 @@ def register(model=None, fields=None, exclude=(), follow=(), format="json",
     return register(model)
 
 
-def _assert_registered(model):
-    if not is_registered(model):
-        raise RegistrationError("{model} has not been registered with django-reversion".format(
-            model=model,
-        ))
+def _raise_not_registered(model):
+    raise RegistrationError("{model} has not been registered with django-reversion".format(
+        model=model,
+    ))
 
 
 def _get_options(model):
-    _assert_registered(model)
-    return _registered_models[_get_registration_key(model)]
+    version_options = _registered_models.get(_get_registration_key(model))
+    if version_options is None:
+        _raise_not_registered(model)
+    return version_options
 
 
 def unregister(model):
-    _assert_registered(model)
-    del _registered_models[_get_registration_key(model)]
+    if _registered_models.pop(_get_registration_key(model), None) is None:
+        _raise_not_registered(model)
     # Disconnect signals.
     for sender, signal, signal_receiver in _get_senders_and_signals(model):
         signal.disconnect(signal_receiver, sender=sender)
 
 
 def _get_content_type(model, using):
+    return _get_content_type_for_options(model, _get_options(model), using)
+
+
+def _get_content_type_for_options(model, version_options, using):
     from django.contrib.contenttypes.models import ContentType
-    version_options = _get_options(model)
     return ContentType.objects.db_manager(using).get_for_model(
         model,
         for_concrete_model=version_options.for_concrete_model,
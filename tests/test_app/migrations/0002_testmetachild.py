@@ -0,0 +1,22 @@
+# Generated by Django 3.1.14 on 2026-10-15 10:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('test_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TestMetaChild',
+            fields=[
+                ('testmeta_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='test_app.testmeta')),
+                ('child_name', models.CharField(default='child v1', max_length=191)),
+            ],
+            bases=('test_app.testmeta',),
+        ),
+    ]
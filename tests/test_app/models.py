@@ -120,6 +120,14 @@ class TestMeta(models.Model):
     )
 
 
+class TestMetaChild(TestMeta):
+
+    child_name = models.CharField(
+        max_length=191,
+        default="child v1",
+    )
+
+
 class TestModelWithNaturalKeyManager(models.Manager):
     def get_by_natural_key(self, name):
         return self.get(name=name)
@@ -1,10 +1,13 @@
+from contextlib import contextmanager
 from datetime import timedelta
 from importlib import import_module, reload
 from io import StringIO
+from unittest.mock import patch
 
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.management import call_command
+from django.db import connection
 from django.urls import clear_url_caches
 from django.test import TestCase, TransactionTestCase
 from django.test.utils import override_settings
@@ -64,6 +67,24 @@ class TestBaseMixin(object):
                 revision=revision,
             ).exists())
 
+    @contextmanager
+    def assertFollowNumQueries(self, num):
+        # Counts the queries made while following relations. The createinitialrevisions command calls
+        # reset_queries(), so the queries are recorded with an execute wrapper.
+        queries = []
+        follow_relations = reversion.revisions._follow_relations
+
+        def record_query(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        def record_follow_queries(*args, **kwargs):
+            with connection.execute_wrapper(record_query):
+                return list(follow_relations(*args, **kwargs))
+        with patch("reversion.revisions._follow_relations", record_follow_queries):
+            yield
+        self.assertEqual(len(queries), num, queries)
+
     def assertNoRevision(self, using=None):
         self.assertEqual(Revision.objects.using(using).all().count(), 0)
 
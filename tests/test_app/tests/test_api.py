@@ -1,12 +1,19 @@
+import inspect
 from datetime import timedelta
-from unittest.mock import MagicMock
+from threading import Thread
+from unittest.mock import MagicMock, patch
 
 from django.contrib.auth.models import User
+from django.core import serializers
 from django.db import models
 from django.db.transaction import get_connection
 from django.utils import timezone
 import reversion
-from test_app.models import TestModel, TestModelRelated, TestModelThrough, TestModelParent, TestMeta
+from reversion.models import Version
+from test_app.models import (
+    TestModel, TestModelRelated, TestModelThrough, TestModelParent, TestMeta, TestMetaChild, TestModelInline,
+    TestModelNestedInline,
+)
 from test_app.tests.base import TestBase, TestBaseTransaction, TestModelMixin, UserMixin
 
 
@@ -52,6 +59,21 @@ class RegisterTest(TestBase):
         with self.assertRaises(reversion.RegistrationError):
             reversion.register(TestModel)
 
+    def testRegisterInvalidField(self):
+        with self.assertRaises(reversion.RegistrationError):
+            reversion.register(TestModel, fields=("name", "foo"))
+        self.assertFalse(reversion.is_registered(TestModel))
+
+    def testRegisterFormatRegisteredLater(self):
+        reversion.register(TestModel, format="test_json")
+        serializers.register_serializer("test_json", "django.core.serializers.json")
+        try:
+            with reversion.create_revision():
+                obj = TestModel.objects.create()
+            self.assertEqual(Version.objects.get_for_object(obj).get().field_dict["name"], "v1")
+        finally:
+            serializers.unregister_serializer("test_json")
+
     def testRegisterM2MSThroughLazy(self):
         # When register is used as a decorator in models.py, lazy relations haven't had a chance to be resolved, so
         # will still be a string.
@@ -87,12 +109,44 @@ class CreateRevisionTest(TestModelMixin, TestBase):
             obj = TestModel.objects.create()
         self.assertSingleRevision((obj,))
 
+    def testCreateRevisionMany(self):
+        with reversion.create_revision():
+            objs = [TestModel.objects.create(name="obj {}".format(n)) for n in range(10)]
+        self.assertSingleRevision(objs)
+
     def testCreateRevisionNested(self):
         with reversion.create_revision():
             with reversion.create_revision():
                 obj = TestModel.objects.create()
         self.assertSingleRevision((obj,))
 
+    def testCreateRevisionSaveTwice(self):
+        with reversion.create_revision():
+            obj = TestModel.objects.create()
+            obj.save()
+            obj.name = "v2"
+            obj.save()
+        self.assertSingleRevision((obj,))
+        self.assertEqual(Version.objects.get_for_object(obj).get().field_dict["name"], "v2")
+
+    def testCreateRevisionSaveTwiceExcludedField(self):
+        reversion.unregister(TestModel)
+        reversion.register(TestModel, exclude=("name",))
+        with patch.object(TestModel, "__str__", lambda obj: "repr {}".format(obj.name)):
+            with reversion.create_revision():
+                obj = TestModel.objects.create(name="a")
+                obj.name = "b"
+                obj.save()
+        self.assertEqual(Version.objects.get_for_object(obj).get().object_repr, "repr b")
+
+    def testCreateRevisionOtherThread(self):
+        results = []
+        with reversion.create_revision():
+            thread = Thread(target=lambda: results.append(reversion.is_active()))
+            thread.start()
+            thread.join()
+        self.assertEqual(results, [False])
+
     def testCreateRevisionEmpty(self):
         with reversion.create_revision():
             pass
@@ -207,6 +261,26 @@ class CreateRevisionFollowTest(TestBase):
             )
         self.assertSingleRevision((obj, obj_through, obj_related))
 
+    def testCreateRevisionFollowChainStackDepth(self):
+        reversion.register(TestModelNestedInline, follow=("test_model_inline",))
+        reversion.register(TestModelInline, follow=("test_model",))
+        reversion.register(TestModel)
+        depths = []
+        follow_relations = reversion.revisions._follow_relations
+
+        def record_depth(*args, **kwargs):
+            depths.append(len(inspect.stack(0)))
+            return follow_relations(*args, **kwargs)
+        obj = TestModel.objects.create()
+        obj_inline = TestModelInline.objects.create(test_model=obj)
+        with patch("reversion.revisions._follow_relations", record_depth):
+            with reversion.create_revision():
+                obj_nested_inline = TestModelNestedInline.objects.create(test_model_inline=obj_inline)
+        self.assertSingleRevision((obj_nested_inline, obj_inline, obj))
+        # Following the chain doesn't make the stack any deeper.
+        self.assertEqual(len(depths), 3)
+        self.assertEqual(len(set(depths)), 1)
+
     def testCreateRevisionFollowInvalid(self):
         reversion.register(TestModel, follow=("name",))
         with reversion.create_revision():
@@ -224,6 +298,34 @@ class CreateRevisionIgnoreDuplicatesTest(TestBase):
             obj.save()
         self.assertSingleRevision((obj,))
 
+    def testCreateRevisionIgnoreDuplicatesChanged(self):
+        reversion.register(TestModel, ignore_duplicates=True)
+        with reversion.create_revision():
+            obj = TestModel.objects.create()
+        with reversion.create_revision():
+            obj.name = "v2"
+            obj.save()
+        self.assertEqual(Version.objects.get_for_object(obj).count(), 2)
+
+    def testCreateRevisionIgnoreDuplicatesLatest(self):
+        reversion.register(TestModel, ignore_duplicates=True)
+        with reversion.create_revision():
+            obj = TestModel.objects.create()
+        with reversion.create_revision():
+            obj.name = "v2"
+            obj.save()
+        # Only the latest version counts, so going back to an earlier state is not a duplicate.
+        with reversion.create_revision():
+            obj.name = "v1"
+            obj.save()
+        self.assertEqual(
+            [version.field_dict["name"] for version in Version.objects.get_for_object(obj)],
+            ["v1", "v2", "v1"],
+        )
+        with reversion.create_revision():
+            obj.save()
+        self.assertEqual(Version.objects.get_for_object(obj).count(), 3)
+
 
 class CreateRevisionInheritanceTest(TestModelMixin, TestBase):
 
@@ -332,6 +434,21 @@ class AddMetaTest(TestModelMixin, TestBase):
             obj = TestModel.objects.create()
         self.assertSingleRevision((obj,), meta_names=("meta v1",))
 
+    def testAddMetaMultiple(self):
+        with reversion.create_revision():
+            reversion.add_meta(TestMeta, name="meta v1")
+            reversion.add_meta(TestMeta, name="meta v2")
+            obj = TestModel.objects.create()
+        self.assertSingleRevision((obj,), meta_names=("meta v1", "meta v2"))
+
+    def testAddMetaInherited(self):
+        with reversion.create_revision():
+            reversion.add_meta(TestMetaChild, name="meta v1")
+            reversion.add_meta(TestMetaChild, name="meta v2")
+            obj = TestModel.objects.create()
+        self.assertSingleRevision((obj,), meta_names=("meta v1", "meta v2"))
+        self.assertEqual(TestMetaChild.objects.count(), 2)
+
     def testAddMetaNoBlock(self):
         with self.assertRaises(reversion.RevisionManagementError):
             reversion.add_meta(TestMeta, name="meta v1")
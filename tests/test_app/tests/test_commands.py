@@ -3,7 +3,8 @@ from datetime import timedelta
 from django.core.management import CommandError
 from django.utils import timezone
 import reversion
-from test_app.models import TestModel
+from reversion.models import Version
+from test_app.models import TestModel, TestModelRelated, TestModelInline, TestModelNestedInline
 from test_app.tests.base import TestBase, TestModelMixin
 
 
@@ -14,6 +15,29 @@ class CreateInitialRevisionsTest(TestModelMixin, TestBase):
         self.callCommand("createinitialrevisions")
         self.assertSingleRevision((obj,), comment="Initial version.")
 
+    def testCreateInitialRevisionsFollow(self):
+        reversion.unregister(TestModel)
+        reversion.register(TestModel, follow=("related",))
+        reversion.register(TestModelRelated)
+        obj_related = TestModelRelated.objects.create()
+        obj = TestModel.objects.create()
+        obj.related.add(obj_related)
+        self.callCommand("createinitialrevisions", "test_app.TestModel")
+        self.assertSingleRevision((obj, obj_related), comment="Initial version.")
+
+    def testCreateInitialRevisionsFollowNumQueries(self):
+        reversion.register(TestModelInline, follow=("test_model", "testmodelnestedinline_set"))
+        reversion.register(TestModelNestedInline)
+        obj = TestModel.objects.create()
+        for _ in range(3):
+            obj_inline = TestModelInline.objects.create(test_model=obj)
+            TestModelNestedInline.objects.create(test_model_inline=obj_inline)
+            TestModelNestedInline.objects.create(test_model_inline=obj_inline)
+        with self.assertFollowNumQueries(0):
+            self.callCommand("createinitialrevisions", "test_app.TestModelInline")
+        self.assertEqual(Version.objects.get_for_model(TestModelInline).count(), 3)
+        self.assertEqual(Version.objects.get_for_model(TestModelNestedInline).count(), 6)
+
     def testCreateInitialRevisionsAlreadyCreated(self):
         obj = TestModel.objects.create()
         self.callCommand("createinitialrevisions")
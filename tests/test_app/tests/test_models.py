@@ -1,3 +1,7 @@
+import inspect
+from unittest.mock import patch
+
+from django.core import serializers
 import reversion
 from reversion.models import Version
 from test_app.models import (
@@ -256,6 +260,31 @@ class FieldDictTest(TestModelMixin, TestBase):
         })
 
 
+class SerializedDataTest(TestBase):
+
+    def testSerializedDataFollow(self):
+        reversion.register(TestModel, follow=("related",))
+        reversion.register(TestModelRelated)
+        obj_related_1 = TestModelRelated.objects.create(name="related 1")
+        obj_related_2 = TestModelRelated.objects.create(name="related \u2603")
+        with reversion.create_revision():
+            obj = TestModel.objects.create()
+            obj.related.add(obj_related_1, obj_related_2)
+        for instance in (obj, obj_related_1, obj_related_2):
+            self.assertEqual(
+                Version.objects.get_for_object(instance).get().serialized_data,
+                serializers.serialize("json", (instance,)),
+            )
+
+    def testSerializedDataXml(self):
+        reversion.register(TestModel, format="xml")
+        with reversion.create_revision():
+            obj = TestModel.objects.create()
+        version = Version.objects.get_for_object(obj).get()
+        self.assertEqual(version.serialized_data, serializers.serialize("xml", (obj,)))
+        self.assertEqual(version.field_dict["name"], "v1")
+
+
 class FieldDictFieldsTest(TestBase):
 
     def testFieldDictFieldFields(self):
@@ -266,6 +295,14 @@ class FieldDictFieldsTest(TestBase):
             "name": "v1",
         })
 
+    def testFieldDictFieldsNonConcrete(self):
+        reversion.register(TestModel, fields=("name", "testmodelinline", "generic_inlines"))
+        with reversion.create_revision():
+            obj = TestModel.objects.create()
+        self.assertEqual(Version.objects.get_for_object(obj).get().field_dict, {
+            "name": "v1",
+        })
+
 
 class FieldDictExcludeTest(TestBase):
 
@@ -423,6 +460,43 @@ class RevisionRevertDeleteTest(TestBase):
             list(child_a.testmodelnestedinline_set.all()), [grandchild_a]
         )
 
+    def testRevertDeleteFollowNumQueries(self):
+        reversion.register(TestModel)
+        reversion.register(TestModelInline, follow=("test_model", "testmodelnestedinline_set"))
+        reversion.register(TestModelNestedInline)
+        with reversion.create_revision():
+            obj = TestModel.objects.create()
+            for _ in range(3):
+                obj_inline = TestModelInline.objects.create(test_model=obj)
+                TestModelNestedInline.objects.create(test_model_inline=obj_inline)
+        obj_nested_inline = TestModelNestedInline.objects.create(test_model_inline=obj_inline)
+        with self.assertFollowNumQueries(0):
+            Version.objects.get_for_object(obj).get().revision.revert(delete=True)
+        self.assertFalse(TestModelNestedInline.objects.filter(pk=obj_nested_inline.pk).exists())
+        self.assertEqual(TestModelNestedInline.objects.count(), 3)
+
+    def testRevertDeleteFollowChainStackDepth(self):
+        reversion.register(TestModel, follow=("testmodelinline_set",))
+        reversion.register(TestModelInline, follow=("testmodelnestedinline_set",))
+        reversion.register(TestModelNestedInline)
+        with reversion.create_revision():
+            obj = TestModel.objects.create()
+        obj_inline = TestModelInline.objects.create(test_model=obj)
+        obj_nested_inline = TestModelNestedInline.objects.create(test_model_inline=obj_inline)
+        depths = []
+        follow_relations = reversion.revisions._follow_relations
+
+        def record_depth(*args, **kwargs):
+            depths.append(len(inspect.stack(0)))
+            return follow_relations(*args, **kwargs)
+        with patch("reversion.revisions._follow_relations", record_depth):
+            Version.objects.get_for_object(obj)[0].revision.revert(delete=True)
+        self.assertFalse(TestModelInline.objects.filter(pk=obj_inline.pk).exists())
+        self.assertFalse(TestModelNestedInline.objects.filter(pk=obj_nested_inline.pk).exists())
+        # Following the chain doesn't make the stack any deeper.
+        self.assertEqual(len(depths), 3)
+        self.assertEqual(len(set(depths)), 1)
+
 
 class NaturalKeyTest(TestBase):
 